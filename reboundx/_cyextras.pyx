@@ -0,0 +1,57 @@
+# cython: language_level=3
+"""
+Optional Cython fast path for the short numeric REBOUNDx C functions (radiation force helpers,
+Hamiltonians and potentials) that are typically called from Python driver loops.
+The function pointers are resolved once from the already loaded libreboundx shared library, so
+no extra linking is needed, and each call goes straight to C without any ctypes argument boxing.
+If this module isn't built, reboundx.extras falls back to calling the same functions through ctypes.
+"""
+from libc.stdint cimport uintptr_t
+from ctypes import cast, c_void_p
+from . import clibreboundx
+
+ctypedef double (*rad_func)(double, double, double, double, double, double, double)
+ctypedef double (*extras_force_func)(void*, void*)
+ctypedef double (*extras_func)(void*)
+
+cdef void* _load(name) except NULL:
+    return <void*><uintptr_t>cast(getattr(clibreboundx, name), c_void_p).value
+
+cdef rad_func _rad_calc_beta = <rad_func>_load("rebx_rad_calc_beta")
+cdef rad_func _rad_calc_particle_radius = <rad_func>_load("rebx_rad_calc_particle_radius")
+cdef extras_force_func _gr_hamiltonian = <extras_force_func>_load("rebx_gr_hamiltonian")
+cdef extras_force_func _gr_full_hamiltonian = <extras_force_func>_load("rebx_gr_full_hamiltonian")
+cdef extras_force_func _gr_potential_potential = <extras_force_func>_load("rebx_gr_potential_potential")
+cdef extras_func _tides_constant_time_lag_potential = <extras_func>_load("rebx_tides_constant_time_lag_potential")
+cdef extras_func _tides_spin_energy = <extras_func>_load("rebx_tides_spin_energy")
+cdef extras_func _central_force_potential = <extras_func>_load("rebx_central_force_potential")
+cdef extras_func _gravitational_harmonics_potential = <extras_func>_load("rebx_gravitational_harmonics_potential")
+
+# Structures are passed by address (ctypes.addressof) of the Extras and Force instances.
+
+def rad_calc_beta(double G, double c, double source_mass, double source_luminosity, double radius, double density, double Q_pr):
+    return _rad_calc_beta(G, c, source_mass, source_luminosity, radius, density, Q_pr)
+
+def rad_calc_particle_radius(double G, double c, double source_mass, double source_luminosity, double beta, double density, double Q_pr):
+    return _rad_calc_particle_radius(G, c, source_mass, source_luminosity, beta, density, Q_pr)
+
+def gr_hamiltonian(uintptr_t rebx, uintptr_t force):
+    return _gr_hamiltonian(<void*>rebx, <void*>force)
+
+def gr_full_hamiltonian(uintptr_t rebx, uintptr_t force):
+    return _gr_full_hamiltonian(<void*>rebx, <void*>force)
+
+def gr_potential_potential(uintptr_t rebx, uintptr_t force):
+    return _gr_potential_potential(<void*>rebx, <void*>force)
+
+def tides_constant_time_lag_potential(uintptr_t rebx):
+    return _tides_constant_time_lag_potential(<void*>rebx)
+
+def tides_spin_energy(uintptr_t rebx):
+    return _tides_spin_energy(<void*>rebx)
+
+def central_force_potential(uintptr_t rebx):
+    return _central_force_potential(<void*>rebx)
+
+def gravitational_harmonics_potential(uintptr_t rebx):
+    return _gravitational_harmonics_potential(<void*>rebx)
@@ -1,8 +1,17 @@
 from . import clibreboundx
-from ctypes import Structure, c_double, POINTER, c_int, c_uint, c_long, c_ulong, c_void_p, c_char_p, CFUNCTYPE, byref, c_uint32, c_uint, cast, c_char, pointer
+from ctypes import Structure, c_double, POINTER, c_int, c_uint, c_long, c_ulong, c_void_p, c_char_p, CFUNCTYPE, byref, c_uint32, c_uint, cast, c_char, pointer, addressof
 import rebound
 import reboundx
 import warnings
+import functools
+import threading
+import weakref
+from types import MappingProxyType
+
+try: # optional Cython fast path for the hot numeric wrappers. Falls back to ctypes if it isn't built
+    from . import _cyextras as _fastpath
+except ImportError:
+    _fastpath = None
 
 integrators = {"implicit_midpoint": 0, "rk4":1, "euler": 2, "rk2": 3, "none": -1}
 
@@ -10,23 +19,51 @@ REBX_TIMING = {"pre":-1, "post":1}
 REBX_FORCE_TYPE = {"none":0, "pos":1, "vel":2}
 REBX_OPERATOR_TYPE = {"none":0, "updater":1, "recorder":2}
 
-REBX_BINARY_WARNINGS = [
-    (True, 1, "REBOUNDx: Cannot open binary file. Check filename."),
-    (True, 2, "REBOUNDx: Binary file is unreadable. Please open an issue on Github mentioning the version of REBOUND and REBOUNDx you are using and include the binary file."),
-    (True, 4, "REBOUNDx: Ran out of system memory."),
-    (True, 8, "REBOUNDx: REBOUNDx structure couldn't be loaded."),
-    (True, 16, "REBOUNDx: At least one registered parameter was not loaded. This typically indicates the binary is corrupt or was saved with an incompatible version to the current one being used."),
-    (False, 32, "REBOUNDx: At least one force or operator parameter was not loaded from the binary file. This typically indicates the binary is corrupt or was saved with an incompatible version to the current one being used."),
-    (False, 64, "REBOUNDx: At least one particle's parameters were not loaded from the binary file."),
-    (False, 128, "REBOUNDx: At least one force was not loaded from the binary file. If binary was created with a newer version of REBOUNDx, a particular force may not be implemented in your current version of REBOUNDx."),
-    (False, 256, "REBOUNDx: At least one operator was not loaded from the binary file. If binary was created with a newer version of REBOUNDx, a particular force may not be implemented in your current version of REBOUNDx."),
-    (False, 512, "REBOUNDx: At least one operator step was not loaded from the binary file."),
-    (False, 1024, "REBOUNDx: At least one force was not added to the simulation. If binary was created with a newer version of REBOUNDx, a particular force may not be implemented in your current version of REBOUNDx."),
-    (False, 2048, "REBOUNDx: Unknown field found in binary file. Any unknown fields not loaded.  This can happen if the binary was created with a later version of REBOUNDx than the one used to read it."),
-    (False, 4096, "REBOUNDx: Unknown list in the REBOUNDx structure wasn't loaded. This can happen if the binary was created with a later version of REBOUNDx than the one used to read it."),
-    (False, 8192, "REBOUNDx: The value of at least one parameter was not loaded. This can happen if a custom structure was added by the user as a parameter. See Parameters.ipynb jupyter notebook example."),
-    (False,16384, "REBOUNDx: Binary file was saved with a different version of REBOUNDx. Binary format might have changed. Check that effects and parameters are loaded as expected.")
-]
+REBX_BINARY_ERRORS = { # bit in rebx_input_binary_messages -> message. Loading cannot continue
+    1: "REBOUNDx: Cannot open binary file. Check filename.",
+    2: "REBOUNDx: Binary file is unreadable. Please open an issue on Github mentioning the version of REBOUND and REBOUNDx you are using and include the binary file.",
+    4: "REBOUNDx: Ran out of system memory.",
+    8: "REBOUNDx: REBOUNDx structure couldn't be loaded.",
+    16: "REBOUNDx: At least one registered parameter was not loaded. This typically indicates the binary is corrupt or was saved with an incompatible version to the current one being used."
+}
+
+REBX_BINARY_WARNINGS = { # bit in rebx_input_binary_messages -> message. Loaded with warnings
+    32: "REBOUNDx: At least one force or operator parameter was not loaded from the binary file. This typically indicates the binary is corrupt or was saved with an incompatible version to the current one being used.",
+    64: "REBOUNDx: At least one particle's parameters were not loaded from the binary file.",
+    128: "REBOUNDx: At least one force was not loaded from the binary file. If binary was created with a newer version of REBOUNDx, a particular force may not be implemented in your current version of REBOUNDx.",
+    256: "REBOUNDx: At least one operator was not loaded from the binary file. If binary was created with a newer version of REBOUNDx, a particular force may not be implemented in your current version of REBOUNDx.",
+    512: "REBOUNDx: At least one operator step was not loaded from the binary file.",
+    1024: "REBOUNDx: At least one force was not added to the simulation. If binary was created with a newer version of REBOUNDx, a particular force may not be implemented in your current version of REBOUNDx.",
+    2048: "REBOUNDx: Unknown field found in binary file. Any unknown fields not loaded.  This can happen if the binary was created with a later version of REBOUNDx than the one used to read it.",
+    4096: "REBOUNDx: Unknown list in the REBOUNDx structure wasn't loaded. This can happen if the binary was created with a later version of REBOUNDx than the one used to read it.",
+    8192: "REBOUNDx: The value of at least one parameter was not loaded. This can happen if a custom structure was added by the user as a parameter. See Parameters.ipynb jupyter notebook example.",
+    16384: "REBOUNDx: Binary file was saved with a different version of REBOUNDx. Binary format might have changed. Check that effects and parameters are loaded as expected."
+}
+
+def _check_binary_messages(w):
+    if not w: # common case, nothing to report
+        return
+    for bit, message in REBX_BINARY_ERRORS.items():
+        if w & bit:
+            raise RuntimeError(message)
+    for bit, message in REBX_BINARY_WARNINGS.items():
+        if w & bit:
+            warnings.warn(message, RuntimeWarning)
+
+_scratch = threading.local() # per-thread ctypes out-parameters reused across C calls, e.g. when loading many binaries
+
+def _scratch_int():
+    try:
+        w = _scratch.wint
+    except AttributeError:
+        w = _scratch.wint = c_int()
+    w.value = 0
+    return w
+
+@functools.lru_cache(maxsize=256) # bounded, since params keys and effect names can be generated (e.g. in a parameter sweep)
+def _cstr(name):
+    # ascii-encoded effect and parameter names, so repeated lookups don't re-encode them on every call
+    return name.encode('ascii')
 
 class Extras(Structure):
     """
@@ -41,32 +78,29 @@ class Extras(Structure):
         return rebx
 
     def __init__(self, sim, filename=None):
+        _bind()
         sim._extras_ref = self # add a reference to this instance in sim to make sure it's not garbage collected_
-        clibreboundx.rebx_initialize(byref(sim), byref(self))
+        clibreboundx.rebx_initialize(sim, self)
         # Create simulation
         if filename==None:
             # Create a new rebx instance
-           clibreboundx.rebx_register_default_params(byref(self))
+           clibreboundx.rebx_register_default_params(self)
         else:
             # Recreate existing simulation.
             # Load registered parameters from binary
-            w = c_int(0)
-            clibreboundx.rebx_init_extras_from_binary(byref(self), c_char_p(filename.encode('ascii')), byref(w))
-            for majorerror, value, message in REBX_BINARY_WARNINGS:
-                if w.value & value:
-                    if majorerror:
-                        raise RuntimeError(message)
-                    else:
-                        warnings.warn(message, RuntimeWarning)
+            w = _scratch_int()
+            clibreboundx.rebx_init_extras_from_binary(self, filename.encode('ascii'), byref(w))
+            _check_binary_messages(w.value)
         self.process_messages()
 
     def __del__(self):
+        self._sim_cached = (None, None)
         if self._b_needsfree_ == 1:
-            clibreboundx.rebx_free_pointers(byref(self))
+            clibreboundx.rebx_free_pointers(self)
 
     def detach(self, sim):
         sim._extras_ref = None # remove reference to rebx so it can be garbage collected
-        clibreboundx.rebx_detach(byref(sim), byref(self))
+        clibreboundx.rebx_detach(sim, self)
 
     #######################################
     # Functions for manipulating REBOUNDx effects
@@ -74,60 +108,72 @@ class Extras(Structure):
 
     def register_param(self, name, param_type):
         type_enum = REBX_C_PARAM_TYPES[param_type]
-        clibreboundx.rebx_register_param(byref(self), c_char_p(name.encode('ascii')), c_int(type_enum))
+        clibreboundx.rebx_register_param(self, _cstr(name), type_enum)
         self.process_messages()
 
+    def get_param_array(self, param_name):
+        """
+        Returns a numpy array with the value of the double parameter param_name for every particle in the simulation.
+        All values are fetched in a single call into C, rather than one particle.params[param_name] lookup per particle.
+        Particles that don't have the parameter set get NaN.
+        """
+        import numpy as np
+        sim = self._sim_obj
+        if sim is None:
+            self.process_messages() # raises AttributeError for a missing simulation
+        name = _cstr(param_name)
+        if REBX_CTYPES[clibreboundx.rebx_get_type(self, name)] is None:
+            raise AttributeError("REBOUNDx Error: Parameter '{0}' not found in REBOUNDx. Need to register it first.".format(param_name))
+        values = np.empty(sim.N, dtype=np.float64)
+        clibreboundx.rebx_get_param_array(self, name, values.ctypes.data, values.size)
+        self.process_messages()
+        return values
+
     def load_force(self, name):
-        clibreboundx.rebx_load_force.restype = POINTER(Force)
-        ptr = clibreboundx.rebx_load_force(byref(self), c_char_p(name.encode('ascii')))
+        ptr = clibreboundx.rebx_load_force(self, _cstr(name))
         self.process_messages()
         return ptr.contents
 
     def create_force(self, name):
-        clibreboundx.rebx_create_force.restype = POINTER(Force)
-        ptr = clibreboundx.rebx_create_force(byref(self), c_char_p(name.encode('ascii')))
+        ptr = clibreboundx.rebx_create_force(self, _cstr(name))
         self.process_messages()
         return ptr.contents
 
     def load_operator(self, name):
-        clibreboundx.rebx_load_operator.restype = POINTER(Operator)
-        ptr = clibreboundx.rebx_load_operator(byref(self), c_char_p(name.encode('ascii')))
+        ptr = clibreboundx.rebx_load_operator(self, _cstr(name))
         self.process_messages()
         return ptr.contents
 
     def create_operator(self, name):
-        clibreboundx.rebx_create_operator.restype = POINTER(Operator)
-        ptr = clibreboundx.rebx_create_operator(byref(self), c_char_p(name.encode('ascii')))
+        ptr = clibreboundx.rebx_create_operator(self, _cstr(name))
         self.process_messages()
         return ptr.contents
 
     def add_force(self, force):
         if not isinstance(force, reboundx.extras.Force):
             raise TypeError("REBOUNDx Error: Object passed to rebx.add_force is not a reboundx.Force instance.")
-        clibreboundx.rebx_add_force(byref(self), byref(force))
+        clibreboundx.rebx_add_force(self, force)
         self.process_messages()
 
     def add_operator(self, operator, dtfraction=None, timing="post"):
         if not isinstance(operator, reboundx.extras.Operator):
             raise TypeError("REBOUNDx Error: Object passed to rebx.add_operator is not a reboundx.Operator instance.")
         if dtfraction is None:
-            clibreboundx.rebx_add_operator(byref(self), byref(operator))
+            clibreboundx.rebx_add_operator(self, operator)
         else:
             timingint = REBX_TIMING[timing]
-            clibreboundx.rebx_add_operator_step(byref(self), byref(operator), c_double(dtfraction), c_int(timingint))
+            clibreboundx.rebx_add_operator_step(self, operator, dtfraction, timingint)
         self.process_messages()
 
     def get_force(self, name):
-        clibreboundx.rebx_get_force.restype = POINTER(Force)
-        ptr = clibreboundx.rebx_get_force(byref(self), c_char_p(name.encode('ascii')))
+        ptr = clibreboundx.rebx_get_force(self, _cstr(name))
         if ptr:
             return ptr.contents
         else:
             raise AttributeError("REBOUNDx Error: Force {0} passed to rebx.get_force not found.".format(name))
 
     def get_operator(self, name):
-        clibreboundx.rebx_get_operator.restype = POINTER(Operator)
-        ptr = clibreboundx.rebx_get_operator(byref(self), c_char_p(name.encode('ascii')))
+        ptr = clibreboundx.rebx_get_operator(self, _cstr(name))
         self.process_messages()
         if ptr:
             return ptr.contents
@@ -137,14 +183,14 @@ class Extras(Structure):
     def remove_force(self, force):
         if not isinstance(force, reboundx.extras.Force):
             raise TypeError("REBOUNDx Error: Object passed to rebx.remove_force is not a reboundx.Force instance.")
-        success = clibreboundx.rebx_remove_force(byref(self), byref(force))
+        success = clibreboundx.rebx_remove_force(self, force)
         if not success:
             raise AttributeError("REBOUNDx Error: Force {0} passed to rebx.remove_force not found in simulation.")
 
     def remove_operator(self, operator):
         if not isinstance(operator, reboundx.extras.Operator):
             raise TypeError("REBOUNDx Error: Object passed to rebx.remove_operator is not a reboundx.Operator instance.")
-        success = clibreboundx.rebx_remove_operator(byref(self), byref(operator))
+        success = clibreboundx.rebx_remove_operator(self, operator)
         if not success:
             raise AttributeError("REBOUNDx Error: Operator {0} passed to rebx.remove_operator not found in simulation.")
 
@@ -155,7 +201,7 @@ class Extras(Structure):
         """
         Save the entire REBOUND simulation to a binary file.
         """
-        clibreboundx.rebx_output_binary(byref(self), c_char_p(filename.encode("ascii")))
+        clibreboundx.rebx_output_binary(self, filename.encode("ascii"))
         self.process_messages()
 
     #######################################
@@ -163,52 +209,25 @@ class Extras(Structure):
     #######################################
     
     def initialize_spin_ode(self, force):
-        clibreboundx.rebx_spin_initialize_ode.restype = None
-        return clibreboundx.rebx_spin_initialize_ode(byref(self), byref(force))
+        return clibreboundx.rebx_spin_initialize_ode(self, force)
 
     def rad_calc_beta(self, G, c, source_mass, source_luminosity, radius, density, Q_pr):
-        clibreboundx.rebx_rad_calc_beta.restype = c_double
-        return clibreboundx.rebx_rad_calc_beta(c_double(G), c_double(c), c_double(source_mass), c_double(source_luminosity), c_double(radius), c_double(density), c_double(Q_pr))
+        if _fastpath is not None:
+            return _fastpath.rad_calc_beta(G, c, source_mass, source_luminosity, radius, density, Q_pr)
+        return clibreboundx.rebx_rad_calc_beta(G, c, source_mass, source_luminosity, radius, density, Q_pr)
 
     def rad_calc_particle_radius(self, G, c, source_mass, source_luminosity, beta, density, Q_pr):
-        clibreboundx.rebx_rad_calc_particle_radius.restype = c_double
-        return clibreboundx.rebx_rad_calc_particle_radius(c_double(G), c_double(c), c_double(source_mass), c_double(source_luminosity), c_double(beta), c_double(density), c_double(Q_pr))
+        if _fastpath is not None:
+            return _fastpath.rad_calc_particle_radius(G, c, source_mass, source_luminosity, beta, density, Q_pr)
+        return clibreboundx.rebx_rad_calc_particle_radius(G, c, source_mass, source_luminosity, beta, density, Q_pr)
 
     def central_force_Acentral(self, p, primary, pomegadot, gamma):
-        clibreboundx.rebx_central_force_Acentral.restype = c_double
-        Acentral = clibreboundx.rebx_central_force_Acentral(p, primary, c_double(pomegadot), c_double(gamma))
+        Acentral = clibreboundx.rebx_central_force_Acentral(p, primary, pomegadot, gamma)
         self.process_messages()
         return Acentral
 
-    # Hamiltonian calculation functions
-    def gr_full_hamiltonian(self, force):
-        clibreboundx.rebx_gr_full_hamiltonian.restype = c_double
-        return clibreboundx.rebx_gr_full_hamiltonian(byref(self), byref(force))
-
-    def gr_hamiltonian(self, force):
-        clibreboundx.rebx_gr_hamiltonian.restype = c_double
-        return clibreboundx.rebx_gr_hamiltonian(byref(self), byref(force))
-
-    # Potential calculation functions
-    def gr_potential_potential(self, force):
-        clibreboundx.rebx_gr_potential_potential.restype = c_double
-        return clibreboundx.rebx_gr_potential_potential(byref(self), byref(force))
-
-    def tides_constant_time_lag_potential(self):
-        clibreboundx.rebx_tides_constant_time_lag_potential.restype = c_double
-        return clibreboundx.rebx_tides_constant_time_lag_potential(byref(self))
-
-    def tides_spin_energy(self):
-        clibreboundx.rebx_tides_spin_energy.restype = c_double
-        return clibreboundx.rebx_tides_spin_energy(byref(self))
-
-    def central_force_potential(self):
-        clibreboundx.rebx_central_force_potential.restype = c_double
-        return clibreboundx.rebx_central_force_potential(byref(self))
-
-    def gravitational_harmonics_potential(self):
-        clibreboundx.rebx_gravitational_harmonics_potential.restype = c_double
-        return clibreboundx.rebx_gravitational_harmonics_potential(byref(self))
+    # Hamiltonian and potential calculation functions (gr_hamiltonian, central_force_potential etc.) are
+    # generated from REBX_ENERGY_FUNCTIONS after the C signatures are bound at the bottom of this module
 
     # Functions to help with rotations
 
@@ -220,22 +239,36 @@ class Extras(Structure):
         """
         if not isinstance(q, rebound.Rotation):
             raise NotImplementedError
-        clibreboundx.rebx_simulation_irotate.restype = None
-        clibreboundx.rebx_simulation_irotate(byref(self), q)
+        clibreboundx.rebx_simulation_irotate(self, q)
   
     def spin_angular_momentum(self):
         """
         Returns a list of the three (x,y,z) components of the spin angular momentum of all particles in the simulation with
         moment of inertia (I) and spin angular frequency vector (Omega) parameters set.
         """
-        clibreboundx.rebx_tools_spin_angular_momentum.restype = rebound.Vec3dBasic
-        return rebound.Vec3d(clibreboundx.rebx_tools_spin_angular_momentum(byref(self)))
+        return rebound.Vec3d(clibreboundx.rebx_tools_spin_angular_momentum(self))
 
-    def process_messages(self):
+    @property
+    def _sim_obj(self):
+        # Simulation proxy for the _sim pointer, cached so that every call doesn't build a new one through _sim.contents.
+        # The cache is keyed on the pointer's address, since the C side sets it to NULL on detach or when the Simulation is freed.
         try:
-            self._sim.contents.process_messages()
-        except ValueError: # _sim is NULL
+            simaddr = self._sim_addr
+        except AttributeError: # from_address rather than from_buffer so the view doesn't hold a reference cycle back to self
+            simaddr = self._sim_addr = c_void_p.from_address(addressof(self) + Extras._sim.offset)
+            self._sim_cached = (None, None)
+        addr = simaddr.value
+        cached_addr, sim = self._sim_cached
+        if addr != cached_addr:
+            sim = rebound.Simulation.from_address(addr) if addr else None
+            self._sim_cached = (addr, sim)
+        return sim
+
+    def process_messages(self):
+        sim = self._sim_obj
+        if sim is None: # _sim is NULL
             raise AttributeError("REBOUNDx Error: The Simulation instance REBOUNDx was attached to no longer exists. This can happen if the Simulation instance goes out of scope or otherwise gets garbage collected.")
+        sim.process_messages()
 #################################################
 # Generic REBOUNDx definitions
 #################################################
@@ -243,15 +276,24 @@ class Extras(Structure):
 
 class Param(Structure): # need to define fields afterward because of circular ref in linked list
     pass
+# Layout must match struct rebx_param in reboundx.h (field order and C types)
 Param._fields_ =  [ ("name", c_char_p),
                     ("type", c_int),
                     ("value", c_void_p)]
 
 class Node(Structure): # need to define fields afterward because of circular ref in linked list
     pass
+# Layout must match struct rebx_node in reboundx.h
 Node._fields_ =  [  ("object", c_void_p),
                     ("next", POINTER(Node))]
 
+# ctypes trampolines for Python step/force functions, so reassigning the same one (e.g. when creating many
+# operators in a parameter sweep) doesn't build a new closure each time. Keyed on id(func), which also works for
+# unhashable callables. Entries only live as long as some Force/Operator holds the trampoline (in _ffp/_sfp),
+# and a live trampoline keeps func alive, so its id can't be reused by another function
+_step_cb_cache = weakref.WeakValueDictionary()
+_force_cb_cache = weakref.WeakValueDictionary()
+
 class Operator(Structure):
     @property
     def operator_type(self):
@@ -267,11 +309,13 @@ class Operator(Structure):
 
     @step_function.setter
     def step_function(self, func):
-        self._sfp = STEPFUNCPTR(func) # keep a reference to func so it doesn't get garbage collected
+        self._sfp = _step_cb_cache.get(id(func))
+        if self._sfp is None:
+            self._sfp = _step_cb_cache[id(func)] = STEPFUNCPTR(func) # keep a reference to func so it doesn't get garbage collected
         self._step_function = self._sfp
 
     def step(self, sim, dt):
-        self._step_function(byref(sim), byref(self), dt)
+        self._step_function(sim, self, dt)
 
     @property
     def params(self):
@@ -280,6 +324,7 @@ class Operator(Structure):
 
 STEPFUNCPTR = CFUNCTYPE(None, POINTER(rebound.Simulation), POINTER(Operator), c_double)
 
+# Layout must match struct rebx_operator in reboundx.h. _operator_type stays c_int to mirror the C enum
 Operator._fields_ = [   ("name", c_char_p),
                         ("ap", POINTER(Node)),
                         ("_sim", POINTER(rebound.Simulation)),
@@ -300,7 +345,9 @@ class Force(Structure):
 
     @update_accelerations.setter
     def update_accelerations(self, func):
-        self._ffp = FORCEFUNCPTR(func) # keep a reference to func so it doesn't get garbage collected
+        self._ffp = _force_cb_cache.get(id(func))
+        if self._ffp is None:
+            self._ffp = _force_cb_cache[id(func)] = FORCEFUNCPTR(func) # keep a reference to func so it doesn't get garbage collected
         self._update_accelerations = self._ffp
 
     @property
@@ -310,6 +357,7 @@ class Force(Structure):
 
 FORCEFUNCPTR = CFUNCTYPE(None, POINTER(rebound.Simulation), POINTER(Force), POINTER(rebound.Particle), c_int)
 
+# Layout must match struct rebx_force in reboundx.h. _force_type stays c_int to mirror the C enum
 Force._fields_ = [  ("name", c_char_p),
                     ("ap", POINTER(Node)),
                     ("_sim", POINTER(rebound.Simulation)),
@@ -317,6 +365,7 @@ Force._fields_ = [  ("name", c_char_p),
                     ("_update_accelerations", FORCEFUNCPTR)]
 
 # Need to put fields after class definition because of self-referencing
+# Layout must match struct rebx_extras in reboundx.h
 Extras._fields_ =  [("_sim", POINTER(rebound.Simulation)),
                     ("_additional_forces", POINTER(Node)),
                     ("_pre_timestep_modifications", POINTER(Node)),
@@ -346,16 +395,16 @@ class Interpolator(Structure):
             raise ValueError("REBOUNDx Error: Interpolation type not supported")
 
         DblArr = c_double * Nvalues
-        clibreboundx.rebx_init_interpolator(byref(rebx), byref(self), c_int(Nvalues), DblArr(*times), DblArr(*values), c_int(interp))
+        clibreboundx.rebx_init_interpolator(rebx, self, Nvalues, DblArr(*times), DblArr(*values), interp)
 
     def interpolate(self, rebx, t):
-        clibreboundx.rebx_interpolate.restype = c_double
-        return clibreboundx.rebx_interpolate(byref(rebx), byref(self), c_double(t))
+        return clibreboundx.rebx_interpolate(rebx, self, t)
 
     def __del__(self):
         if self._b_needsfree_ == 1:
-            clibreboundx.rebx_free_interpolator_pointers(byref(self))
+            clibreboundx.rebx_free_interpolator_pointers(self)
 
+# Layout must match struct rebx_interpolator in reboundx.h
 Interpolator._fields_ = [  ("interpolation", c_int),
                     ("times", POINTER(c_double)),
                     ("values", POINTER(c_double)),
@@ -367,10 +416,135 @@ INTERPOLATION_TYPE = {"none":0, "spline":1}
 
 # This list keeps pairing from C rebx_param_type enum to ctypes type 1-to-1. Derive the required mappings from it
 REBX_C_TO_CTYPES = [["REBX_TYPE_NONE", None], ["REBX_TYPE_DOUBLE", c_double], ["REBX_TYPE_INT",c_int], ["REBX_TYPE_POINTER", c_void_p], ["REBX_TYPE_FORCE", Force], ["REBX_TYPE_UNIT32", c_uint32], ["REBX_TYPE_ORBIT", rebound.Orbit], ["REBX_TYPE_ODE", rebound.ODE], ["REBX_TYPE_VEC3D", rebound.Vec3d]]
-REBX_CTYPES = {} # maps int value of rebx_param_type enum to ctypes type
-REBX_C_PARAM_TYPES = {} # maps string of rebx_param_type enum to int
-for i, pair in enumerate(REBX_C_TO_CTYPES):
-    REBX_CTYPES[i] = pair[1]
-    REBX_C_PARAM_TYPES[pair[0]] = i
+REBX_CTYPES = MappingProxyType({i: ctype for i, (_, ctype) in enumerate(REBX_C_TO_CTYPES)}) # maps int value of rebx_param_type enum to ctypes type (read-only)
+REBX_C_PARAM_TYPES = MappingProxyType({name: i for i, (name, _) in enumerate(REBX_C_TO_CTYPES)}) # maps string of rebx_param_type enum to int (read-only)
+
+#################################################
+# C function signatures. Bound once, rather than on every call or at import. Calls pass structures without byref
+# and rely on these argtypes, so every entry point that reaches libreboundx calls _bind() first: Extras.__init__
+# and Params.__init__ (Force, Operator and Interpolator calls all take an existing Extras). testing.py and
+# tools.py keep their own restype setup, since they call standalone functions without ever creating an Extras
+#################################################
+
+_bound = False
+
+def _bind():
+    global _bound
+    if _bound:
+        return
+    clibreboundx.rebx_initialize.restype = None
+    clibreboundx.rebx_initialize.argtypes = [POINTER(rebound.Simulation), POINTER(Extras)]
+    clibreboundx.rebx_detach.restype = None
+    clibreboundx.rebx_detach.argtypes = [POINTER(rebound.Simulation), POINTER(Extras)]
+    clibreboundx.rebx_register_default_params.restype = None
+    clibreboundx.rebx_register_default_params.argtypes = [POINTER(Extras)]
+    clibreboundx.rebx_init_extras_from_binary.restype = None
+    clibreboundx.rebx_init_extras_from_binary.argtypes = [POINTER(Extras), c_char_p, POINTER(c_int)]
+    clibreboundx.rebx_free_pointers.restype = None
+    clibreboundx.rebx_free_pointers.argtypes = [POINTER(Extras)]
+    clibreboundx.rebx_output_binary.restype = None
+    clibreboundx.rebx_output_binary.argtypes = [POINTER(Extras), c_char_p]
+
+    clibreboundx.rebx_register_param.restype = None
+    clibreboundx.rebx_register_param.argtypes = [POINTER(Extras), c_char_p, c_int]
+    clibreboundx.rebx_get_param_array.restype = c_int
+    clibreboundx.rebx_get_param_array.argtypes = [POINTER(Extras), c_char_p, c_void_p, c_int]
+    clibreboundx.rebx_load_force.restype = POINTER(Force)
+    clibreboundx.rebx_load_force.argtypes = [POINTER(Extras), c_char_p]
+    clibreboundx.rebx_create_force.restype = POINTER(Force)
+    clibreboundx.rebx_create_force.argtypes = [POINTER(Extras), c_char_p]
+    clibreboundx.rebx_get_force.restype = POINTER(Force)
+    clibreboundx.rebx_get_force.argtypes = [POINTER(Extras), c_char_p]
+    clibreboundx.rebx_load_operator.restype = POINTER(Operator)
+    clibreboundx.rebx_load_operator.argtypes = [POINTER(Extras), c_char_p]
+    clibreboundx.rebx_create_operator.restype = POINTER(Operator)
+    clibreboundx.rebx_create_operator.argtypes = [POINTER(Extras), c_char_p]
+    clibreboundx.rebx_get_operator.restype = POINTER(Operator)
+    clibreboundx.rebx_get_operator.argtypes = [POINTER(Extras), c_char_p]
+
+    clibreboundx.rebx_add_force.argtypes = [POINTER(Extras), POINTER(Force)]
+    clibreboundx.rebx_remove_force.argtypes = [POINTER(Extras), POINTER(Force)]
+    clibreboundx.rebx_add_operator.argtypes = [POINTER(Extras), POINTER(Operator)]
+    clibreboundx.rebx_add_operator_step.argtypes = [POINTER(Extras), POINTER(Operator), c_double, c_int]
+    clibreboundx.rebx_remove_operator.argtypes = [POINTER(Extras), POINTER(Operator)]
+
+    clibreboundx.rebx_spin_initialize_ode.restype = None
+    clibreboundx.rebx_spin_initialize_ode.argtypes = [POINTER(Extras), POINTER(Force)]
+    clibreboundx.rebx_rad_calc_beta.restype = c_double
+    clibreboundx.rebx_rad_calc_beta.argtypes = [c_double]*7
+    clibreboundx.rebx_rad_calc_particle_radius.restype = c_double
+    clibreboundx.rebx_rad_calc_particle_radius.argtypes = [c_double]*7
+    clibreboundx.rebx_central_force_Acentral.restype = c_double
+    clibreboundx.rebx_central_force_Acentral.argtypes = [rebound.Particle, rebound.Particle, c_double, c_double]
+
+    clibreboundx.rebx_simulation_irotate.restype = None
+    clibreboundx.rebx_simulation_irotate.argtypes = [POINTER(Extras), rebound.Rotation]
+    clibreboundx.rebx_tools_spin_angular_momentum.restype = rebound.Vec3dBasic
+    clibreboundx.rebx_tools_spin_angular_momentum.argtypes = [POINTER(Extras)]
+    clibreboundx.rebx_init_interpolator.restype = None
+    clibreboundx.rebx_init_interpolator.argtypes = [POINTER(Extras), POINTER(Interpolator), c_int, POINTER(c_double), POINTER(c_double), c_int]
+    clibreboundx.rebx_free_interpolator_pointers.restype = None
+    clibreboundx.rebx_free_interpolator_pointers.argtypes = [POINTER(Interpolator)]
+    clibreboundx.rebx_interpolate.restype = c_double
+    clibreboundx.rebx_interpolate.argtypes = [POINTER(Extras), POINTER(Interpolator), c_double]
+
+    for name, takes_force in REBX_ENERGY_FUNCTIONS:
+        cfn = getattr(clibreboundx, "rebx_" + name)
+        cfn.restype = c_double
+        cfn.argtypes = [POINTER(Extras), POINTER(Force)] if takes_force else [POINTER(Extras)]
+
+    clibreboundx.rebx_get_param.restype = c_void_p
+    clibreboundx.rebx_get_param.argtypes = [POINTER(Extras), c_void_p, c_char_p]
+    clibreboundx.rebx_get_type.restype = c_int
+    clibreboundx.rebx_get_type.argtypes = [POINTER(Extras), c_char_p]
+    clibreboundx.rebx_len.restype = c_int
+    clibreboundx.rebx_len.argtypes = [c_void_p]
+    _bound = True
+
+#################################################
+# Hamiltonian and potential methods of Extras
+#################################################
+
+# (method name, whether the C function also takes the rebx_force). Each maps to the C function rebx_<name>
+REBX_ENERGY_FUNCTIONS = [   ("gr_full_hamiltonian", True),
+                            ("gr_hamiltonian", True),
+                            ("gr_potential_potential", True),
+                            ("tides_constant_time_lag_potential", False),
+                            ("tides_spin_energy", False),
+                            ("central_force_potential", False),
+                            ("gravitational_harmonics_potential", False)]
+
+def _add_energy_method(name, takes_force):
+    # Specialize each method once here, so a call is a single direct call into C (or the Cython fast path)
+    # Check the force type in both branches, since the fast path takes any address and would read e.g. an Operator as a Force
+    msg = "REBOUNDx Error: Object passed to rebx.{0} is not a reboundx.Force instance.".format(name)
+    if _fastpath is not None:
+        fn = getattr(_fastpath, name)
+        if takes_force:
+            def method(self, force):
+                if not isinstance(force, Force):
+                    raise TypeError(msg)
+                return fn(addressof(self), addressof(force))
+        else:
+            def method(self):
+                return fn(addressof(self))
+    else:
+        cfn = getattr(clibreboundx, "rebx_" + name) # signature is set in _bind()
+        if takes_force:
+            def method(self, force):
+                if not isinstance(force, Force):
+                    raise TypeError(msg)
+                return cfn(self, force)
+        else:
+            def method(self):
+                return cfn(self)
+
+    method.__name__ = name
+    method.__qualname__ = "Extras." + name
+    setattr(Extras, name, method)
+
+for name, takes_force in REBX_ENERGY_FUNCTIONS:
+    _add_energy_method(name, takes_force)
+del name, takes_force
 
 from .params import Params
@@ -4,7 +4,7 @@ if sys.version_info[:2] >= (3, 8):
     from collections.abc import MutableMapping
 else:
     from collections import MutableMapping
-from .extras import Param, Node, Force, Operator, Extras, REBX_CTYPES
+from .extras import Param, Node, Force, Operator, Extras, REBX_CTYPES, _cstr, _bind
 from . import clibreboundx
 from ctypes import byref, c_double, c_int, c_int32, c_int64, c_uint, c_uint32, c_longlong, c_char_p, POINTER, cast
 from ctypes import c_void_p, memmove, sizeof, addressof
@@ -12,6 +12,7 @@ from rebound import hash as rebhash
 
 class Params(MutableMapping):
     def __init__(self, parent):
+        _bind() # no-op once bound. See reboundx.extras._bind
         self.verbose = 0        # set to 1 to diagnose problems
         self.parent = parent    # Particle, Force, Operator. Will work with any ctypes.Structure with appropriate ._sim and .ap fields
 
@@ -27,13 +28,13 @@ class Params(MutableMapping):
             self.rebx = cast(extrasvp, POINTER(Extras))
 
     def __getitem__(self, key):
-        param_type = clibreboundx.rebx_get_type(self.rebx, c_char_p(key.encode('ascii')))
+        name = _cstr(key)
+        param_type = clibreboundx.rebx_get_type(self.rebx, name)
         ctype = REBX_CTYPES[param_type]
         if ctype == None:
             raise AttributeError("REBOUNDx Error: Parameter '{0}' not found in REBOUNDx. Need to register it first.".format(key))
 
-        clibreboundx.rebx_get_param.restype = c_void_p
-        valptr = clibreboundx.rebx_get_param(self.rebx, self.ap, c_char_p(key.encode('ascii')))
+        valptr = clibreboundx.rebx_get_param(self.rebx, self.ap, name)
 
         if ctype == c_void_p: # Don't know how to cast it, so return for user to cast
             if valptr is None:
@@ -57,32 +58,33 @@ class Params(MutableMapping):
         return val
 
     def __setitem__(self, key, value):
-        param_type = clibreboundx.rebx_get_type(self.rebx, c_char_p(key.encode('ascii')))
+        name = _cstr(key)
+        param_type = clibreboundx.rebx_get_type(self.rebx, name)
         ctype = REBX_CTYPES[param_type]
         if ctype == None:
             raise AttributeError("REBOUNDx Error: Parameter '{0}' not found in REBOUNDx. Need to register it first.".format(key))
         if ctype == c_double:
-            clibreboundx.rebx_set_param_double(self.rebx, byref(self.ap), c_char_p(key.encode('ascii')), c_double(value))
+            clibreboundx.rebx_set_param_double(self.rebx, byref(self.ap), name, c_double(value))
         if ctype == c_int:
-            clibreboundx.rebx_set_param_int(self.rebx, byref(self.ap), c_char_p(key.encode('ascii')), c_int(value))
+            clibreboundx.rebx_set_param_int(self.rebx, byref(self.ap), name, c_int(value))
         if ctype == c_uint32:
-            clibreboundx.rebx_set_param_uint32(self.rebx, byref(self.ap), c_char_p(key.encode('ascii')), value)
+            clibreboundx.rebx_set_param_uint32(self.rebx, byref(self.ap), name, value)
         if ctype == rebound.Vec3d:
-            clibreboundx.rebx_set_param_vec3d(self.rebx, byref(self.ap), c_char_p(key.encode('ascii')), rebound.Vec3d(value)._vec3d)
+            clibreboundx.rebx_set_param_vec3d(self.rebx, byref(self.ap), name, rebound.Vec3d(value)._vec3d)
         if ctype == Force:
             if not isinstance(value, Force):
                 raise AttributeError("REBOUNDx Error: Parameter '{0}' must be assigned a Force object.".format(key))
-            clibreboundx.rebx_set_param_pointer(self.rebx, byref(self.ap), c_char_p(key.encode('ascii')), byref(value))
+            clibreboundx.rebx_set_param_pointer(self.rebx, byref(self.ap), name, byref(value))
         if ctype == rebound.Orbit:
             if not isinstance(value, rebound.Orbit):
                 raise AttributeError("REBOUNDx Error: Parameter '{0}' must be assigned an Orbit object.".format(key))
-            clibreboundx.rebx_set_param_pointer(self.rebx, byref(self.ap), c_char_p(key.encode('ascii')), byref(value))
+            clibreboundx.rebx_set_param_pointer(self.rebx, byref(self.ap), name, byref(value))
         if ctype == rebound.ODE:
             if not isinstance(value, rebound.ODE):
                 raise AttributeError("REBOUNDx Error: Parameter '{0}' must be assigned a rebound.ODE object.".format(key))
-            clibreboundx.rebx_set_param_pointer(self.rebx, byref(self.ap), c_char_p(key.encode('ascii')), byref(value))
+            clibreboundx.rebx_set_param_pointer(self.rebx, byref(self.ap), name, byref(value))
         if ctype == c_void_p:
-            clibreboundx.rebx_set_param_pointer(self.rebx, byref(self.ap), c_char_p(key.encode('ascii')), byref(value))
+            clibreboundx.rebx_set_param_pointer(self.rebx, byref(self.ap), name, byref(value))
 
     def __delitem__(self, key):
         raise AttributeError("REBOUNDx Error: Removing particle params not implemented.")
@@ -91,5 +93,4 @@ class Params(MutableMapping):
         raise AttributeError("REBOUNDx Error: Iterator for params not implemented.")
 
     def __len__(self):
-        clibreboundx.rebx_len.restype = c_int
         return clibreboundx.rebx_len(self.ap)
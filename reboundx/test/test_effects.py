@@ -1,6 +1,7 @@
 import rebound
 import reboundx
 import unittest
+import gc
 
 class TestForces(unittest.TestCase):
     def setUp(self):
@@ -26,6 +27,43 @@ class TestForces(unittest.TestCase):
         self.sim.integrate(10)
         self.assertGreater(self.sim.particles[1].pomega, -0.01)
 
+    def test_customforcereuse(self):
+        def myforce(sim, force, particles, N):
+            sim.contents.particles[1].ax += 1.e-4
+        cust1 = self.rebx.create_force('myforce1')
+        cust1.update_accelerations = myforce
+        cust2 = self.rebx.create_force('myforce2')
+        cust2.update_accelerations = myforce
+        self.assertIs(cust1._ffp, cust2._ffp)
+        cust2.force_type = 'pos'
+        self.rebx.add_force(cust2)
+        self.sim.integrate(10)
+        self.assertGreater(self.sim.particles[1].pomega, -0.01)
+
+    def test_customforceunhashable(self):
+        class MyForce(object):
+            def __eq__(self, other):
+                return self is other
+            def __call__(self, sim, force, particles, N):
+                sim.contents.particles[1].ax += 1.e-4
+        cust = self.rebx.create_force('myforce')
+        cust.update_accelerations = MyForce()
+        cust.force_type = 'pos'
+        self.rebx.add_force(cust)
+        self.sim.integrate(10)
+        self.assertGreater(self.sim.particles[1].pomega, -0.01)
+
+    def test_customforcecachereleased(self):
+        Ncached = len(reboundx.extras._force_cb_cache)
+        for i in range(10):
+            def myforce(sim, force, particles, N):
+                sim.contents.particles[1].ax += 1.e-4
+            cust = self.rebx.create_force('myforce{0}'.format(i))
+            cust.update_accelerations = myforce
+        del cust, myforce
+        gc.collect()
+        self.assertEqual(len(reboundx.extras._force_cb_cache), Ncached)
+
     def test_customnoforce(self):
         cust = self.rebx.create_force('myforce')
         cust.force_type = 'pos'
@@ -195,6 +195,24 @@ class TestParams(unittest.TestCase):
             for p in self.gr.params:
                 pass
 
+    def test_param_array(self):
+        self.sim.add(a=2.)
+        self.sim.particles[0].params['c'] = 1.5
+        self.sim.particles[2].params['c'] = 2.5
+        values = self.rebx.get_param_array('c')
+        self.assertEqual(values.shape, (3,))
+        self.assertEqual(values[0], 1.5)
+        self.assertTrue(math.isnan(values[1]))
+        self.assertEqual(values[2], 2.5)
+
+    def test_param_array_not_double(self):
+        with self.assertRaises(RuntimeError):
+            self.rebx.get_param_array('gr_source')
+
+    def test_param_array_unregistered(self):
+        with self.assertRaises(AttributeError):
+            self.rebx.get_param_array('notregistered')
+
     def test_del(self):
         with self.assertRaises(AttributeError):
             del self.gr.params["b"]
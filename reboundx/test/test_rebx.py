@@ -1,6 +1,9 @@
 import rebound
 import reboundx
 import unittest
+import os
+import subprocess
+import sys
 
 class TestRebx(unittest.TestCase):
     def setUp(self):
@@ -15,7 +18,33 @@ class TestRebx(unittest.TestCase):
         self.gr.params['c'] = 1e2
         self.sim.integrate(10)
         self.assertGreater(self.sim.particles[1].pomega, 1.e-4)
-    
+
+    def test_lazy_bind(self):
+        # Needs a fresh interpreter, since the signatures are already bound in this one
+        code = """
+import rebound, reboundx
+from ctypes import c_int, c_void_p
+from reboundx import clibreboundx
+assert clibreboundx.rebx_get_param.restype is not c_void_p # nothing bound on import
+sim = rebound.Simulation()
+sim.add(m=1.)
+rebx = reboundx.Extras(sim)
+sim.particles[0].params['c'] = 2.5
+assert sim.particles[0].params['c'] == 2.5
+# Params must bind on its own, e.g. if the Extras attached to sim never went through Extras.__init__ in this process
+reboundx.extras._bound = False
+clibreboundx.rebx_get_param.restype = c_int
+assert sim.particles[0].params['c'] == 2.5
+"""
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        proc = subprocess.run([sys.executable, "-c", code], env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        self.assertEqual(proc.returncode, 0, proc.stdout.decode())
+
+    def test_load_missing_binary(self):
+        sim = rebound.Simulation()
+        with self.assertRaises(RuntimeError):
+            reboundx.Extras(sim, "doesnotexist.rebx")
+
     def test_total_angular_momentum(self):
         sim = rebound.Simulation()
         sim.add(m=1)
@@ -56,6 +85,50 @@ class TestRebx(unittest.TestCase):
         self.assertLess(Ltotnew[1], 1e-15)
         self.assertAlmostEqual(Ltotnew[2], L, delta=1e-15)
 
+class TestFastPath(unittest.TestCase):
+    def setUp(self):
+        self.sim = rebound.Simulation()
+        self.sim.add(m=1.)
+        self.sim.add(m=1e-3, a=1., e=0.2)
+        self.rebx = reboundx.Extras(self.sim)
+        self.gr = self.rebx.load_force('gr')
+        self.rebx.add_force(self.gr)
+        self.gr.params['c'] = 1e2
+        self.fastpath = reboundx.extras._fastpath
+
+    def tearDown(self):
+        reboundx.extras._fastpath = self.fastpath
+
+    def test_ctypes_fallback(self):
+        beta = self.rebx.rad_calc_beta(1., 1.e4, 1., 1., 1.e-5, 1., 1.)
+        reboundx.extras._fastpath = None
+        self.assertEqual(beta, self.rebx.rad_calc_beta(1., 1.e4, 1., 1., 1.e-5, 1., 1.))
+
+    def test_energy_methods(self):
+        H = reboundx.clibreboundx.rebx_gr_hamiltonian(self.rebx, self.gr)
+        self.assertEqual(H, self.rebx.gr_hamiltonian(self.gr))
+        self.assertEqual(self.rebx.gr_hamiltonian.__name__, 'gr_hamiltonian')
+        for name, takes_force in reboundx.extras.REBX_ENERGY_FUNCTIONS:
+            self.assertTrue(callable(getattr(self.rebx, name)))
+
+    def test_energy_methods_wrong_type(self):
+        mm = self.rebx.load_operator('modify_mass')
+        with self.assertRaises(TypeError):
+            self.rebx.gr_hamiltonian(mm)
+        reboundx.extras._fastpath = None
+        reboundx.extras._add_energy_method('gr_hamiltonian', True)
+        try:
+            with self.assertRaises(TypeError):
+                self.rebx.gr_hamiltonian(mm)
+        finally:
+            reboundx.extras._fastpath = self.fastpath
+            reboundx.extras._add_energy_method('gr_hamiltonian', True)
+
+    def test_rad_calc_roundtrip(self):
+        beta = self.rebx.rad_calc_beta(1., 1.e4, 1., 1., 1.e-5, 1., 1.)
+        radius = self.rebx.rad_calc_particle_radius(1., 1.e4, 1., 1., beta, 1., 1.)
+        self.assertAlmostEqual(radius, 1.e-5, delta=1e-18)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -76,6 +76,12 @@ class TestSegFaults(unittest.TestCase):
         with self.assertRaises(AttributeError):
             rebx.load_force("gr")
 
+    def test_detach_then_load(self):
+        sim, rebx = makegr()
+        rebx.detach(sim)
+        with self.assertRaises(AttributeError):
+            rebx.load_force("gr")
+
     def test_delete(self):
         for i in range(10):
             sim, rebx = makegr()
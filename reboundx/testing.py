@@ -4,8 +4,7 @@ These are structures anad functions mainly used for testing from the Python side
 
 from . import clibreboundx
 from ctypes import c_void_p, c_int, c_long, Structure, byref, c_char_p
-import warnings
-from reboundx.extras import REBX_BINARY_WARNINGS
+from reboundx.extras import _check_binary_messages, _scratch_int
 
 REBX_BINARY_FIELD_TYPE = {
         0: 'None',
@@ -48,15 +47,10 @@ class BinaryField(Structure):
         return 'Type: {0}, Size: {1}'.format(self.type, self.size)
 
 def inspect_binary(filename):
-    w = c_int(0)
+    w = _scratch_int()
     clibreboundx.rebx_input_inspect_binary.restype = c_void_p
-    inf = clibreboundx.rebx_input_inspect_binary(c_char_p(filename.encode('ascii')), byref(w))
-    for majorerror, value, message in REBX_BINARY_WARNINGS:
-        if w.value & value:
-            if majorerror:
-                raise RuntimeError(message)
-            else:
-                warnings.warn(message, RuntimeWarning)
+    inf = clibreboundx.rebx_input_inspect_binary(filename.encode('ascii'), byref(w))
+    _check_binary_messages(w.value)
     return inf
 
 def read_binary_field(inf):
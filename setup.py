@@ -100,6 +100,15 @@ libreboundxmodule = Extension('libreboundx',
                     extra_link_args=extra_link_args,
                     )
 
+ext_modules = [libreboundxmodule]
+
+# Optional Cython fast path for the hot numeric wrappers in reboundx.extras (falls back to ctypes if not built)
+try:
+    from Cython.Build import cythonize
+    ext_modules += cythonize([Extension('reboundx._cyextras', sources=['reboundx/_cyextras.pyx'])], language_level=3)
+except ImportError:
+    pass
+
 here = os.path.abspath(os.path.dirname(__file__))
 with open(os.path.join(here, 'README.rst'), encoding='utf-8') as f:
     long_description = f.read()
@@ -140,5 +149,5 @@ setup(name='reboundx',
     install_requires=['rebound>=4.0.0'],
     tests_require=['rebound>=4.0.0','numpy'],
     test_suite="reboundx.test",
-    ext_modules = [libreboundxmodule],
+    ext_modules = ext_modules,
     zip_safe=False)
@@ -723,6 +723,40 @@ void* rebx_get_param(struct rebx_extras* const rebx, struct rebx_node* ap, const
     }
 }
 
+int rebx_get_param_array(struct rebx_extras* const rebx, const char* const param_name, double* const values, const int N){
+    struct reb_simulation* const sim = rebx->sim;
+    if (sim == NULL){
+        rebx_error(rebx, "REBOUNDx Error: rebx_get_param_array needs a Simulation attached to this REBOUNDx extras instance.\n"); // also checked in python, but this is a public C function
+        return 0;
+    }
+    const enum rebx_param_type type = rebx_get_type(rebx, param_name);
+    if (type == REBX_TYPE_NONE){
+        char str[300];
+        snprintf(str, sizeof(str), "REBOUNDx Error: Need to register parameter name '%s' before using it. See examples.\n", param_name);
+        rebx_error(rebx, str);
+        return 0;
+    }
+    if (type != REBX_TYPE_DOUBLE){
+        char str[300];
+        snprintf(str, sizeof(str), "REBOUNDx Error: rebx_get_param_array only supports parameters registered as REBX_TYPE_DOUBLE. '%s' is not.\n", param_name);
+        rebx_error(rebx, str);
+        return 0;
+    }
+    const int Nvalues = N < (int)sim->N ? N : (int)sim->N;
+    int Nfound = 0;
+    for (int i=0; i<Nvalues; i++){
+        const double* const val = rebx_get_param(rebx, sim->particles[i].ap, param_name);
+        if (val == NULL){
+            values[i] = NAN;
+        }
+        else{
+            values[i] = *val;
+            Nfound++;
+        }
+    }
+    return Nfound;
+}
+
 struct rebx_force* rebx_get_force(struct rebx_extras* const rebx, const char* const name){
     struct rebx_node* current = rebx->allocated_forces;
     while(current != NULL){
@@ -416,6 +416,15 @@ int rebx_remove_param(struct rebx_node** apptr, const char* const param_name);
  */
 
 void* rebx_get_param(struct rebx_extras* const rebx, struct rebx_node* ap, const char* const param_name);
+
+/**
+ * @brief Gets a double parameter for every particle in the simulation with a single call.
+ * @param param_name Name of the parameter. Must be registered as REBX_TYPE_DOUBLE.
+ * @param values Array of at least N doubles to fill. Particles without the parameter set get NAN.
+ * @param N Length of values. Only the first min(N, sim->N) particles are filled.
+ * @return Number of particles that had the parameter set.
+ */
+int rebx_get_param_array(struct rebx_extras* const rebx, const char* const param_name, double* const values, const int N);
 struct rebx_param* rebx_get_param_struct(struct rebx_extras* const rebx, struct rebx_node* ap, const char* const param_name);
 void rebx_set_param_pointer(struct rebx_extras* const rebx, struct rebx_node** apptr, const char* const param_name, void* val);
 void rebx_set_param_double(struct rebx_extras* const rebx, struct rebx_node** apptr, const char* const param_name, double val);